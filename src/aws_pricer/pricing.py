@@ -2,13 +2,48 @@
 
 from __future__ import annotations
 
+import functools
+import importlib
+import inspect
 import json
-from collections.abc import Iterable, Mapping
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal, InvalidOperation
-from typing import Any, Final
+from typing import TYPE_CHECKING, Any, Final, TypeVar
+
+if TYPE_CHECKING:
+    # Runtime checks use concrete dict/list — boto3 only ever returns those,
+    # and isinstance against an ABC pays for __instancecheck__ dispatch.
+    from collections.abc import Callable, Iterable, Mapping
+
+    # Hourly USD rates default to exact Decimal arithmetic; callers doing
+    # display or estimation math can pass rate_type=float to skip Decimal
+    # construction.
+    _Rate = Decimal | float
+    _RateParser = Callable[[str], _Rate]
 
 import boto3
 
+
+def _optional_import(name: str) -> Any:
+    """Return the named module, or None when the optional dependency is absent."""
+
+    try:
+        return importlib.import_module(name)
+    except ImportError:  # pragma: no cover - depends on installed extras
+        return None
+
+
+# Optional accelerators from the "speed" extra; each has a stdlib or
+# pure-Python fallback. Typed Any so mypy sees the same module shape whether
+# or not the extras are installed.
+orjson: Any = _optional_import("orjson")
+ijson: Any = _optional_import("ijson")
+numba: Any = _optional_import("numba")
+numpy: Any = _optional_import("numpy")
+
 _PRICING_REGION: Final[str] = "us-east-1"
 _EC2_SERVICE_CODE: Final[str] = "AmazonEC2"
 _TERM_MATCH: Final[str] = "TERM_MATCH"
@@ -22,10 +57,27 @@ _SAVINGS_PLAN_DURATION_LABELS: Final[dict[int, str]] = {
     31_536_000: "1y",
     94_608_000: "3y",
 }
+# Usage types look like "APS2-BoxUsage:m6i.large" ("BoxUsage:..." without a
+# prefix in us-east-1); the anchored pattern is cheaper than an unanchored
+# substring scan and will not match unrelated usage families.
+_BOX_USAGE_RE: Final[re.Pattern[str]] = re.compile(r"(?:^|-)BoxUsage:")
+# Every acceptable (currency, durationSeconds, unit) combination, so the hot
+# loop replaces three separate branches with one hashed membership test.
+_ALLOWED_RATE_TRIPLES: Final[frozenset[tuple[str, int, str]]] = frozenset(
+    (_USD, duration, unit)
+    for duration in _SAVINGS_PLAN_DURATION_LABELS
+    for unit in _SUPPORTED_RATE_UNITS
+)
 _SAVINGS_PLAN_PRODUCT_DESCRIPTION_ALIASES: Final[dict[str, tuple[str, ...]]] = {
     "Linux": ("Linux/UNIX",),
     "Linux/UNIX": ("Linux/UNIX",),
 }
+# Ordered, deduplicated description tuples, expanded from the alias table once
+# at import so lookups need no per-call dict.fromkeys round trip.
+_SAVINGS_PLAN_PRODUCT_DESCRIPTIONS_BY_OS: Final[dict[str, tuple[str, ...]]] = {
+    os_name: tuple(dict.fromkeys((os_name, *aliases)))
+    for os_name, aliases in _SAVINGS_PLAN_PRODUCT_DESCRIPTION_ALIASES.items()
+}
 
 
 _ONDEMAND_FILTERS: Final[tuple[tuple[str, str], ...]] = (
@@ -34,21 +86,171 @@ _ONDEMAND_FILTERS: Final[tuple[tuple[str, str], ...]] = (
     ("preInstalledSw", "NA"),
 )
 
+# The constant filter entries never change, so build their dicts once at
+# import time instead of on every call.
+_ONDEMAND_STATIC_FILTERS: Final[tuple[dict[str, str], ...]] = tuple(
+    {"Type": _TERM_MATCH, "Field": field, "Value": value}
+    for field, value in _ONDEMAND_FILTERS
+)
+
+# Full request template: only the first three entries vary per call, so each
+# lookup copies those and shares the constant dicts (boto3 does not mutate
+# its input). A shared mutable list is deliberately avoided — the thread-pool
+# batch helpers issue these requests concurrently.
+_ONDEMAND_FILTER_TEMPLATE: Final[tuple[dict[str, str], ...]] = (
+    {"Type": _TERM_MATCH, "Field": "instanceType", "Value": ""},
+    {"Type": _TERM_MATCH, "Field": "regionCode", "Value": ""},
+    {"Type": _TERM_MATCH, "Field": "operatingSystem", "Value": ""},
+    {"Type": _TERM_MATCH, "Field": "licenseModel", "Value": _NO_LICENSE_REQUIRED},
+    *_ONDEMAND_STATIC_FILTERS,
+)
+
+# Savings Plans filter skeleton, treated the same way: the first three
+# entries get fresh values per call, the tenancy entry is shared as-is.
+_SAVINGSPLAN_FILTER_TEMPLATE: Final[tuple[dict[str, Any], ...]] = (
+    {"name": "instanceType", "values": ()},
+    {"name": "region", "values": ()},
+    {"name": "productDescription", "values": ()},
+    {"name": "tenancy", "values": ["shared"]},
+)
 
-def get_ondemand_usd_per_hour(*, instance_type: str, region: str, os: str) -> Decimal:
-    """Return the on-demand hourly USD price for an EC2 instance."""
+# Client construction parses service models and builds a fresh connection pool,
+# so cache one client per service. The cache is keyed by the identity of the
+# ``boto3`` module so that tests replacing ``pricing.boto3`` get a fresh client;
+# the module reference is retained alongside the client to keep the id stable.
+_CLIENT_CACHE: dict[tuple[int, str], tuple[Any, Any]] = {}
 
-    client = boto3.client("pricing", region_name=_PRICING_REGION)
-    filters = [
-        {"Type": _TERM_MATCH, "Field": "instanceType", "Value": instance_type},
-        {"Type": _TERM_MATCH, "Field": "regionCode", "Value": region},
-        {"Type": _TERM_MATCH, "Field": "operatingSystem", "Value": os},
-        {"Type": _TERM_MATCH, "Field": "licenseModel", "Value": _NO_LICENSE_REQUIRED},
-    ]
-    filters.extend(
-        {"Type": _TERM_MATCH, "Field": field, "Value": value}
-        for field, value in _ONDEMAND_FILTERS
-    )
+
+def _client(service_name: str) -> Any:
+    key = (id(boto3), service_name)
+    cached = _CLIENT_CACHE.get(key)
+    if cached is None:
+        cached = (boto3, boto3.client(service_name, region_name=_PRICING_REGION))
+        _CLIENT_CACHE[key] = cached
+    return cached[1]
+
+
+def _pricing_client() -> Any:
+    return _client("pricing")
+
+
+def _savingsplans_client() -> Any:
+    return _client("savingsplans")
+
+
+_T = TypeVar("_T")
+
+# Prices change rarely, so memoize successful lookups for an hour. This turns
+# repeat queries for the same (instance_type, region, os) into a dict lookup
+# instead of an AWS HTTPS round trip.
+_PRICE_CACHE_TTL_SECONDS: Final[float] = 3600.0
+_PRICE_CACHE_MAX_ENTRIES: Final[int] = 2048
+
+_ONDEMAND_CACHE: dict[tuple[Any, ...], tuple[float, Any, Any]] = {}
+_SAVINGSPLAN_CACHE: dict[tuple[Any, ...], tuple[float, Any, Any]] = {}
+
+
+def clear_cache() -> None:
+    """Drop all memoized prices and cached boto3 clients."""
+
+    _ONDEMAND_CACHE.clear()
+    _SAVINGSPLAN_CACHE.clear()
+    _CLIENT_CACHE.clear()
+
+
+def _hashable_kwarg(value: Any) -> Any:
+    """Coerce non-string iterables (payment options, sets, generators) to tuples."""
+
+    if isinstance(value, str):
+        return value
+    try:
+        return tuple(value)
+    except TypeError:
+        return value
+
+
+def _cache_key(kwargs: Mapping[str, Any]) -> tuple[Any, ...]:
+    # Keyed by boto3 identity for the same reason as _CLIENT_CACHE.
+    return (id(boto3), *sorted(kwargs.items()))
+
+
+def _copy_result(result: _T) -> _T:
+    # Rate mappings are mutable, so each caller gets its own copy; otherwise a
+    # caller mutating the returned dict would poison every later cache hit.
+    if isinstance(result, dict):
+        return dict(result)  # type: ignore[return-value]
+    return result
+
+
+def _ttl_cached(
+    cache: dict[tuple[Any, ...], tuple[float, Any, Any]],
+) -> Callable[[Callable[..., _T]], Callable[..., _T]]:
+    # The thread-pool helpers call the memoized wrappers concurrently, so the
+    # evict-and-store section is serialized; hits stay lock-free since dict
+    # reads are atomic and cached entries are never mutated in place.
+    lock = threading.Lock()
+
+    def decorator(func: Callable[..., _T]) -> Callable[..., _T]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(**kwargs: Any) -> _T:
+            # Fold in the declared defaults so calls that spell them out share
+            # a cache entry with calls that omit them, and normalize iterable
+            # values so the key is hashable and a generator argument is not
+            # consumed once for the key and again by the wrapped function.
+            bound = signature.bind(**kwargs)
+            bound.apply_defaults()
+            kwargs = {
+                name: _hashable_kwarg(value) for name, value in bound.arguments.items()
+            }
+            key = _cache_key(kwargs)
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry is not None and entry[0] > now:
+                return _copy_result(entry[2])  # type: ignore[no-any-return]
+
+            result = func(**kwargs)
+            with lock:
+                if len(cache) >= _PRICE_CACHE_MAX_ENTRIES:
+                    expired = [k for k, v in list(cache.items()) if v[0] <= now]
+                    for stale_key in expired:
+                        cache.pop(stale_key, None)
+                    if len(cache) >= _PRICE_CACHE_MAX_ENTRIES:
+                        cache.clear()
+                # Retain the boto3 reference so id()-based keys stay
+                # unambiguous; store a private copy for the same reason hits
+                # are copied.
+                cache[key] = (now + _PRICE_CACHE_TTL_SECONDS, boto3, _copy_result(result))
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+@_ttl_cached(_ONDEMAND_CACHE)
+def get_ondemand_usd_per_hour(
+    *,
+    instance_type: str,
+    region: str,
+    os: str,
+    rate_type: _RateParser = Decimal,
+) -> _Rate:
+    """Return the on-demand hourly USD price for an EC2 instance.
+
+    The filters pin down a single product, so ``MaxResults=1`` keeps the
+    response to one PriceList entry and extraction terminates on the first
+    matching price dimension; no paginator is involved on this path.
+    """
+
+    client = _pricing_client()
+    filters = list(_ONDEMAND_FILTER_TEMPLATE)
+    filters[0] = dict(filters[0], Value=instance_type)
+    filters[1] = dict(filters[1], Value=region)
+    filters[2] = dict(filters[2], Value=os)
+    # PaginationConfig belongs to boto3 paginators, not the plain client call;
+    # MaxResults=1 alone bounds the response here.
     response = client.get_products(
         ServiceCode=_EC2_SERVICE_CODE,
         Filters=filters,
@@ -56,19 +258,30 @@ def get_ondemand_usd_per_hour(*, instance_type: str, region: str, os: str) -> De
     )
 
     price_list = response.get("PriceList") or []
+    # Streaming only pays off when several entries may be parsed and rejected;
+    # the MaxResults=1 fast path sticks with the eager orjson/json parse.
+    stream_entries = ijson is not None and len(price_list) > 1
     for entry in price_list:
-        try:
-            price_item = _load_price_list_entry(entry)
-        except (TypeError, json.JSONDecodeError) as exc:  # pragma: no cover - defensive
-            raise ValueError("Invalid pricing payload returned by AWS Pricing API") from exc
+        if stream_entries and isinstance(entry, str):
+            try:
+                price = _stream_ondemand_usd(entry, rate_type=rate_type)
+            except ijson.JSONError as exc:  # pragma: no cover - defensive
+                raise ValueError("Invalid pricing payload returned by AWS Pricing API") from exc
+        else:
+            try:
+                price_item = _load_price_list_entry(entry)
+            except (TypeError, json.JSONDecodeError) as exc:  # pragma: no cover - defensive
+                raise ValueError("Invalid pricing payload returned by AWS Pricing API") from exc
+
+            price = _extract_ondemand_usd(price_item, rate_type=rate_type)
 
-        price = _extract_ondemand_usd(price_item)
         if price is not None:
             return price
 
     raise ValueError("No on-demand pricing data returned by AWS Pricing API")
 
 
+@_ttl_cached(_SAVINGSPLAN_CACHE)
 def get_savingsplan_no_upfront_usd_per_hour(
     *,
     instance_type: str,
@@ -76,141 +289,317 @@ def get_savingsplan_no_upfront_usd_per_hour(
     os: str,
     plan_type: str,
     savingsPlanPaymentOptions: str | Iterable[str] = "No Upfront",
-) -> dict[str, Decimal]:
+    rate_type: _RateParser = Decimal,
+) -> dict[str, _Rate]:
     """Return 1-year and 3-year Savings Plans hourly USD prices."""
 
-    client = boto3.client("savingsplans", region_name=_PRICING_REGION)
+    client = _savingsplans_client()
     product_descriptions = _savings_plan_product_descriptions(os)
-    allowed_product_descriptions = set(product_descriptions)
+    allowed_product_descriptions = _allowed_product_descriptions(os)
+    filters = list(_SAVINGSPLAN_FILTER_TEMPLATE)
+    filters[0] = dict(filters[0], values=[instance_type])
+    filters[1] = dict(filters[1], values=[region])
+    filters[2] = dict(filters[2], values=product_descriptions)
     response = client.describe_savings_plans_offering_rates(
         savingsPlanPaymentOptions=_coerce_payment_options(savingsPlanPaymentOptions),
         savingsPlanTypes=[plan_type],
-        filters=[
-            {"name": "instanceType", "values": [instance_type]},
-            {"name": "region", "values": [region]},
-            {"name": "productDescription", "values": product_descriptions},
-            {"name": "tenancy", "values": ["shared"]},
-        ],
+        filters=filters,
     )
 
     search_results = response.get("searchResults") or []
-    rates: dict[str, Decimal] = {}
+    # Filter pass: extract the surviving records into parallel duration/rate
+    # columns, leaving the min-reduction to a separate tight pass.
+    durations: list[int] = []
+    rate_values: list[str] = []
     for result in search_results:
-        if not isinstance(result, Mapping):  # pragma: no cover - defensive
-            continue
-
-        usage_type = result.get("usageType")
-        if not isinstance(usage_type, str) or "BoxUsage" not in usage_type:
-            continue
-
-        offering = result.get("savingsPlanOffering")
-        if not isinstance(offering, Mapping):
-            continue
+        # boto3 validates responses against the service model, so field types
+        # are trusted here; a malformed record trips the cold exception path
+        # below instead of paying per-field isinstance guards.
+        try:
+            if _BOX_USAGE_RE.search(result["usageType"]) is None:
+                continue
 
-        if offering.get("currency") != _USD:
-            continue
+            offering = result["savingsPlanOffering"]
+            duration = offering["durationSeconds"]
+            rate_key = (offering.get("currency"), duration, result.get("unit") or "Hrs")
+            if rate_key not in _ALLOWED_RATE_TRIPLES:
+                continue
 
-        properties = result.get("properties")
-        if isinstance(properties, Iterable):
-            product_description = _extract_property_value(
-                properties, "productDescription"
-            )
+            property_values = _property_values(result.get("properties") or ())
+            product_description = property_values.get("productDescription")
             if (
                 product_description is not None
                 and product_description not in allowed_product_descriptions
             ):
                 continue
-        else:
-            continue
 
-        duration = offering.get("durationSeconds")
-        if not isinstance(duration, int):
+            rate_value = result["rate"]
+        except (AttributeError, KeyError, TypeError):  # pragma: no cover - defensive
             continue
 
-        label = _SAVINGS_PLAN_DURATION_LABELS.get(duration)
-        if label is None:
-            continue
+        durations.append(duration)
+        rate_values.append(rate_value)
 
-        unit = result.get("unit")
-        if isinstance(unit, str) and unit not in _SUPPORTED_RATE_UNITS:
-            continue
+    rates = _min_rates_by_label(durations, rate_values, rate_type=rate_type)
 
-        rate_value = result.get("rate")
-        if not isinstance(rate_value, str):
-            continue
+    if {"1y", "3y"} - rates.keys():
+        raise ValueError("Savings Plans rates for both 1y and 3y are required")
 
-        try:
-            rate_decimal = Decimal(rate_value)
-        except InvalidOperation as exc:  # pragma: no cover - defensive
-            raise ValueError(f"Invalid Savings Plans rate '{rate_value}' returned by AWS") from exc
+    return rates
 
-        current = rates.get(label)
-        if current is None or rate_decimal < current:
-            rates[label] = rate_decimal
 
-    if {"1y", "3y"} - rates.keys():
-        raise ValueError("Savings Plans rates for both 1y and 3y are required")
+def get_all_rates(
+    *,
+    instance_type: str,
+    region: str,
+    os: str,
+    plan_type: str,
+    rate_type: _RateParser = Decimal,
+) -> dict[str, _Rate]:
+    """Return on-demand and Savings Plans hourly USD prices in one call.
+
+    The two AWS calls are I/O bound, so they are issued concurrently; the
+    result maps ``"ondemand"``, ``"1y"``, and ``"3y"`` to hourly USD prices.
+    """
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ondemand_future = executor.submit(
+            get_ondemand_usd_per_hour,
+            instance_type=instance_type,
+            region=region,
+            os=os,
+            rate_type=rate_type,
+        )
+        savingsplan_future = executor.submit(
+            get_savingsplan_no_upfront_usd_per_hour,
+            instance_type=instance_type,
+            region=region,
+            os=os,
+            plan_type=plan_type,
+            rate_type=rate_type,
+        )
+        rates: dict[str, _Rate] = {"ondemand": ondemand_future.result()}
+        rates.update(savingsplan_future.result())
 
     return rates
 
 
+def get_all_rates_bulk(
+    items: Iterable[Mapping[str, Any]],
+) -> list[dict[str, _Rate]]:
+    """Return :func:`get_all_rates` results for several instances at once.
+
+    Each item supplies the keyword arguments for one :func:`get_all_rates`
+    call; results are returned in input order.
+    """
+
+    requests = [dict(item) for item in items]
+    if not requests:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(32, len(requests))) as executor:
+        futures = [executor.submit(get_all_rates, **request) for request in requests]
+        return [future.result() for future in futures]
+
+
+def get_ondemand_usd_per_hour_bulk(
+    *,
+    instance_types: Iterable[str],
+    region: str,
+    os: str,
+    rate_type: _RateParser = Decimal,
+) -> dict[str, _Rate]:
+    """Return on-demand hourly USD prices keyed by instance type.
+
+    The Pricing API only accepts one instanceType per TERM_MATCH filter, so
+    the per-instance calls are overlapped on a thread pool rather than
+    batched into a single request.
+    """
+
+    wanted = list(dict.fromkeys(instance_types))
+    if not wanted:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(10, len(wanted))) as executor:
+        futures = {
+            instance_type: executor.submit(
+                get_ondemand_usd_per_hour,
+                instance_type=instance_type,
+                region=region,
+                os=os,
+                rate_type=rate_type,
+            )
+            for instance_type in wanted
+        }
+        return {
+            instance_type: future.result() for instance_type, future in futures.items()
+        }
+
+
 def _load_price_list_entry(entry: Any) -> Mapping[str, Any]:
+    # Already-decoded entries pass straight through; extraction's duck-typed
+    # access copes with any non-mapping shape.
     if isinstance(entry, str):
-        loaded = json.loads(entry)
-    elif isinstance(entry, Mapping):
-        loaded = entry
-    else:  # pragma: no cover - defensive
-        raise TypeError(f"Unexpected price list entry type: {type(entry)!r}")
+        if orjson is not None:
+            # orjson wants bytes; encoding up front also skips its UTF-8 probe.
+            return orjson.loads(entry.encode())  # type: ignore[no-any-return]
+        return json.loads(entry)  # type: ignore[no-any-return]
 
-    if not isinstance(loaded, Mapping):  # pragma: no cover - defensive
-        raise TypeError("Decoded price list entry is not a mapping")
+    return entry  # type: ignore[no-any-return]
 
-    return loaded
 
-
-def _extract_ondemand_usd(price_item: Mapping[str, Any]) -> Decimal | None:
-    terms = price_item.get("terms")
-    if not isinstance(terms, Mapping):
+def _extract_ondemand_usd(
+    price_item: Mapping[str, Any],
+    *,
+    rate_type: _RateParser = Decimal,
+) -> _Rate | None:
+    # AWS returns plain dicts with a single OnDemand term on this code path,
+    # so grab the first term directly instead of nesting four loops of ABC
+    # isinstance checks. Only the dimensions are iterated, since a term can
+    # carry dimensions in unsupported units.
+    try:
+        ondemand_terms = price_item["terms"][_ONDEMAND_KEY]
+        term = next(iter(ondemand_terms.values()))
+        dimensions = term[_PRICE_DIMENSIONS_KEY]
+    except (AttributeError, KeyError, StopIteration, TypeError):
         return None
 
-    ondemand_terms = terms.get(_ONDEMAND_KEY)
-    if not isinstance(ondemand_terms, Mapping):
-        return None
+    return _extract_dimensions_usd(dimensions, rate_type=rate_type)
 
-    for term in ondemand_terms.values():
-        if not isinstance(term, Mapping):
-            continue
 
-        dimensions = term.get(_PRICE_DIMENSIONS_KEY)
-        if not isinstance(dimensions, Mapping):
-            continue
+def _stream_ondemand_usd(entry: str, *, rate_type: _RateParser = Decimal) -> _Rate | None:
+    """Stream a PriceList entry and return its first supported USD rate.
 
-        for dimension in dimensions.values():
-            if not isinstance(dimension, Mapping):
-                continue
+    ijson materializes only the values under ``terms.OnDemand``, so entries
+    rejected on unit or currency never build the full dict tree. Like
+    :func:`_extract_ondemand_usd`, only the first OnDemand term is inspected
+    so results do not depend on whether ijson is installed.
+    """
 
-            unit = dimension.get("unit")
-            if isinstance(unit, str) and unit not in _SUPPORTED_RATE_UNITS:
-                continue
+    for _sku, term in ijson.kvitems(entry.encode(), f"terms.{_ONDEMAND_KEY}"):
+        try:
+            dimensions = term[_PRICE_DIMENSIONS_KEY]
+        except (KeyError, TypeError):  # pragma: no cover - defensive
+            return None
+
+        return _extract_dimensions_usd(dimensions, rate_type=rate_type)
+
+    return None
 
-            price_per_unit = dimension.get(_PRICE_PER_UNIT_KEY)
-            if not isinstance(price_per_unit, Mapping):
-                continue
 
-            usd_value = price_per_unit.get(_USD)
-            if not isinstance(usd_value, str):
+def _extract_dimensions_usd(
+    dimensions: Any,
+    *,
+    rate_type: _RateParser = Decimal,
+) -> _Rate | None:
+    # Duck-typed access: boto3 only hands us dicts, so shape problems are
+    # routed through the cold exception paths rather than isinstance guards.
+    try:
+        dimension_values = dimensions.values()
+    except AttributeError:  # pragma: no cover - defensive
+        return None
+
+    for dimension in dimension_values:
+        try:
+            unit = dimension.get("unit")
+            if unit is not None and unit not in _SUPPORTED_RATE_UNITS:
                 continue
 
-            try:
-                return Decimal(usd_value)
-            except InvalidOperation as exc:  # pragma: no cover - defensive
-                raise ValueError(
-                    f"Invalid on-demand USD price '{usd_value}' returned by AWS"
-                ) from exc
+            usd_value = dimension[_PRICE_PER_UNIT_KEY][_USD]
+        except (AttributeError, KeyError, TypeError):  # pragma: no cover - defensive
+            continue
+
+        try:
+            return rate_type(usd_value)
+        except (InvalidOperation, TypeError, ValueError) as exc:  # pragma: no cover - defensive
+            raise ValueError(
+                f"Invalid on-demand USD price '{usd_value}' returned by AWS"
+            ) from exc
 
     return None
 
 
+# Below this many records the pure-Python reduction wins; Numba's dispatch
+# overhead only pays off on large paginated result sets.
+_COMPILED_REDUCTION_MIN_RESULTS: Final[int] = 64
+
+if numba is not None:
+
+    @numba.njit(cache=True)  # type: ignore[untyped-decorator]
+    def _argmin_by_duration(durations: Any, rates: Any) -> tuple[int, int]:
+        # Durations mirror _SAVINGS_PLAN_DURATION_LABELS: 1y and 3y in seconds.
+        idx_1y = -1
+        idx_3y = -1
+        min_1y = numpy.inf
+        min_3y = numpy.inf
+        for i in range(durations.size):
+            rate = rates[i]
+            if durations[i] == 31_536_000:
+                if rate < min_1y:
+                    min_1y = rate
+                    idx_1y = i
+            elif rate < min_3y:
+                min_3y = rate
+                idx_3y = i
+        return idx_1y, idx_3y
+
+
+def _min_rates_by_label_compiled(
+    durations: list[int],
+    rate_values: list[str],
+    *,
+    rate_type: _RateParser,
+) -> dict[str, _Rate]:
+    """Reduce the columns with the Numba kernel, keyed on winning indices.
+
+    The kernel compares float64 views but the returned rates are re-parsed
+    from the winning records' original strings, so rate_type=Decimal keeps
+    exact values.
+    """
+
+    duration_array = numpy.asarray(durations, dtype=numpy.int64)
+    try:
+        rate_array = numpy.array(rate_values, dtype=numpy.float64)
+    except ValueError as exc:  # pragma: no cover - defensive
+        raise ValueError("Invalid Savings Plans rate returned by AWS") from exc
+
+    idx_1y, idx_3y = _argmin_by_duration(duration_array, rate_array)
+    rates: dict[str, _Rate] = {}
+    if idx_1y >= 0:
+        rates["1y"] = rate_type(rate_values[idx_1y])
+    if idx_3y >= 0:
+        rates["3y"] = rate_type(rate_values[idx_3y])
+    return rates
+
+
+def _min_rates_by_label(
+    durations: list[int],
+    rate_values: list[str],
+    *,
+    rate_type: _RateParser,
+) -> dict[str, _Rate]:
+    """Reduce parallel duration/rate columns to the minimum rate per label."""
+
+    if numba is not None and len(durations) > _COMPILED_REDUCTION_MIN_RESULTS:
+        return _min_rates_by_label_compiled(durations, rate_values, rate_type=rate_type)
+
+    # Pre-seeding every label with Infinity (valid for Decimal and float)
+    # removes the per-record "first value seen" branch from the loop.
+    infinity = rate_type("Infinity")
+    minimums: dict[str, _Rate] = dict.fromkeys(_SAVINGS_PLAN_DURATION_LABELS.values(), infinity)
+    for duration, rate_value in zip(durations, rate_values, strict=True):
+        try:
+            rate = rate_type(rate_value)
+        except (InvalidOperation, TypeError, ValueError) as exc:  # pragma: no cover - defensive
+            raise ValueError(f"Invalid Savings Plans rate '{rate_value}' returned by AWS") from exc
+
+        label = _SAVINGS_PLAN_DURATION_LABELS[duration]
+        if rate < minimums[label]:
+            minimums[label] = rate
+
+    return {label: rate for label, rate in minimums.items() if rate is not infinity}
+
+
 def _coerce_payment_options(value: str | Iterable[str]) -> list[str]:
     if isinstance(value, str):
         return [value]
@@ -221,27 +610,33 @@ def _coerce_payment_options(value: str | Iterable[str]) -> list[str]:
 
     return options
 def _savings_plan_product_descriptions(os: str) -> list[str]:
-    aliases = _SAVINGS_PLAN_PRODUCT_DESCRIPTION_ALIASES.get(os)
-    if aliases is None:
-        return [os]
+    return list(_SAVINGS_PLAN_PRODUCT_DESCRIPTIONS_BY_OS.get(os, (os,)))
 
-    # Use dict.fromkeys to preserve order while removing duplicates.
-    return list(dict.fromkeys((os, *aliases)))
 
+# The OS aliasing table is static, so the frozenset forms are precomputed at
+# import; unknown OS names are filled in lazily on first use.
+_ALLOWED_PRODUCT_DESCRIPTIONS_CACHE: dict[str, frozenset[str]] = {
+    os_name: frozenset(descriptions)
+    for os_name, descriptions in _SAVINGS_PLAN_PRODUCT_DESCRIPTIONS_BY_OS.items()
+}
 
-def _extract_property_value(
-    properties: Iterable[Any],
-    name: str,
-) -> str | None:
-    for prop in properties:
-        if not isinstance(prop, Mapping):
-            continue
 
-        if prop.get("name") != name:
-            continue
+def _allowed_product_descriptions(os: str) -> frozenset[str]:
+    allowed = _ALLOWED_PRODUCT_DESCRIPTIONS_CACHE.get(os)
+    if allowed is None:
+        allowed = frozenset(_savings_plan_product_descriptions(os))
+        _ALLOWED_PRODUCT_DESCRIPTIONS_CACHE[os] = allowed
+    return allowed
 
-        value = prop.get("value")
-        if isinstance(value, str):
-            return value
 
-    return None
+def _property_values(properties: Iterable[Any]) -> dict[str, str]:
+    """Map property names to their values in a single pass over the list."""
+
+    values: dict[str, str] = {}
+    for prop in properties:
+        try:
+            values[prop["name"]] = prop["value"]
+        except (KeyError, TypeError):  # pragma: no cover - defensive
+            continue
+
+    return values
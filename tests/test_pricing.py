@@ -227,6 +227,89 @@ def test_get_savingsplan_no_upfront_usd_per_hour_prefers_box_usage_rates(
     }
 
 
+def test_get_all_rates_combines_ondemand_and_savings_plan_rates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    if not hasattr(pricing, "get_all_rates"):
+        pytest.fail("pricing.get_all_rates is not implemented")
+
+    price_list_entry = pricing_fixtures.make_price_list_entry(usd_per_hour="0.096")
+    pricing_client = DummyPricingClient(
+        response={"PriceList": [price_list_entry], "FormatVersion": "aws_v1"}
+    )
+    savingsplans_client = DummySavingsPlansClient(
+        response={
+            "searchResults": [
+                pricing_fixtures.make_savings_plan_result(
+                    usd_per_hour="0.052", duration_seconds=31_536_000
+                ),
+                pricing_fixtures.make_savings_plan_result(
+                    usd_per_hour="0.047", duration_seconds=94_608_000
+                ),
+            ]
+        }
+    )
+
+    def _fake_client(service_name: str, region_name: str | None = None) -> Any:
+        if service_name == "pricing":
+            return pricing_client
+        assert service_name == "savingsplans"
+        return savingsplans_client
+
+    _patch_boto3(monkeypatch, fake_client=_fake_client)
+
+    result = pricing.get_all_rates(
+        instance_type="m6i.large",
+        region="ap-southeast-2",
+        os="Linux",
+        plan_type="Compute",
+    )
+
+    assert result == {
+        "ondemand": Decimal("0.096"),
+        "1y": Decimal("0.052"),
+        "3y": Decimal("0.047"),
+    }
+    assert pricing_client.calls, "Expected get_all_rates to fetch on-demand pricing"
+    assert savingsplans_client.calls, "Expected get_all_rates to fetch Savings Plans rates"
+
+
+def test_get_ondemand_usd_per_hour_bulk_prices_each_instance_type(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    if not hasattr(pricing, "get_ondemand_usd_per_hour_bulk"):
+        pytest.fail("pricing.get_ondemand_usd_per_hour_bulk is not implemented")
+
+    prices = {"m6i.large": "0.096", "m5.large": "0.089"}
+
+    class BulkPricingClient:
+        def get_products(self, **kwargs: Any) -> dict[str, Any]:
+            filters = {entry["Field"]: entry["Value"] for entry in kwargs["Filters"]}
+            entry = pricing_fixtures.make_price_list_entry(
+                usd_per_hour=prices[filters["instanceType"]]
+            )
+            return {"PriceList": [entry], "FormatVersion": "aws_v1"}
+
+    client = BulkPricingClient()
+
+    def _fake_client(service_name: str, region_name: str | None = None) -> BulkPricingClient:
+        assert service_name == "pricing"
+        return client
+
+    _patch_boto3(monkeypatch, fake_client=_fake_client)
+
+    result = pricing.get_ondemand_usd_per_hour_bulk(
+        instance_types=["m6i.large", "m5.large"],
+        region="ap-southeast-2",
+        os="Linux",
+    )
+
+    assert result == {
+        "m6i.large": Decimal("0.096"),
+        "m5.large": Decimal("0.089"),
+    }
+
+
 def test_get_savingsplan_no_upfront_usd_per_hour_requires_one_and_three_year_rates(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -256,3 +339,352 @@ def test_get_savingsplan_no_upfront_usd_per_hour_requires_one_and_three_year_rat
             plan_type="Compute",
             savingsPlanPaymentOptions="No Upfront",
         )
+
+
+def _savings_plan_response() -> dict[str, Any]:
+    return {
+        "searchResults": [
+            pricing_fixtures.make_savings_plan_result(
+                usd_per_hour="0.052", duration_seconds=31_536_000
+            ),
+            pricing_fixtures.make_savings_plan_result(
+                usd_per_hour="0.047", duration_seconds=94_608_000
+            ),
+        ]
+    }
+
+
+def test_get_ondemand_usd_per_hour_memoizes_repeat_lookups(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    if not hasattr(pricing, "clear_cache"):
+        pytest.fail("pricing.clear_cache is not implemented")
+
+    price_list_entry = pricing_fixtures.make_price_list_entry(usd_per_hour="0.096")
+    client = DummyPricingClient(
+        response={"PriceList": [price_list_entry], "FormatVersion": "aws_v1"}
+    )
+
+    def _fake_client(service_name: str, region_name: str | None = None) -> DummyPricingClient:
+        return client
+
+    _patch_boto3(monkeypatch, fake_client=_fake_client)
+
+    kwargs = {"instance_type": "m6i.large", "region": "ap-southeast-2", "os": "Linux"}
+    first = pricing.get_ondemand_usd_per_hour(**kwargs)
+    second = pricing.get_ondemand_usd_per_hour(**kwargs)
+
+    assert first == second == Decimal("0.096")
+    assert len(client.calls) == 1, "Expected the second lookup to be served from cache"
+
+    pricing.clear_cache()
+    pricing.get_ondemand_usd_per_hour(**kwargs)
+    assert len(client.calls) == 2, "Expected clear_cache to force a fresh AWS call"
+
+
+def test_memoized_prices_expire_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    price_list_entry = pricing_fixtures.make_price_list_entry(usd_per_hour="0.096")
+    client = DummyPricingClient(
+        response={"PriceList": [price_list_entry], "FormatVersion": "aws_v1"}
+    )
+
+    def _fake_client(service_name: str, region_name: str | None = None) -> DummyPricingClient:
+        return client
+
+    _patch_boto3(monkeypatch, fake_client=_fake_client)
+    clock = {"now": 0.0}
+    monkeypatch.setattr(
+        pricing,
+        "time",
+        types.SimpleNamespace(monotonic=lambda: clock["now"]),
+    )
+
+    kwargs = {"instance_type": "m6i.large", "region": "ap-southeast-2", "os": "Linux"}
+    pricing.get_ondemand_usd_per_hour(**kwargs)
+    clock["now"] = 3599.0
+    pricing.get_ondemand_usd_per_hour(**kwargs)
+    assert len(client.calls) == 1
+
+    clock["now"] = 3601.0
+    pricing.get_ondemand_usd_per_hour(**kwargs)
+    assert len(client.calls) == 2, "Expected the cached price to expire after the TTL"
+
+
+def test_savingsplan_cache_hits_return_fresh_mappings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = DummySavingsPlansClient(response=_savings_plan_response())
+
+    def _fake_client(service_name: str, region_name: str | None = None) -> DummySavingsPlansClient:
+        return client
+
+    _patch_boto3(monkeypatch, fake_client=_fake_client)
+
+    kwargs = {
+        "instance_type": "m6i.large",
+        "region": "ap-southeast-2",
+        "os": "Linux",
+        "plan_type": "Compute",
+    }
+    first = pricing.get_savingsplan_no_upfront_usd_per_hour(**kwargs)
+    first["1y"] = Decimal("999")
+
+    second = pricing.get_savingsplan_no_upfront_usd_per_hour(**kwargs)
+    assert second == {"1y": Decimal("0.052"), "3y": Decimal("0.047")}
+    assert len(client.calls) == 1, "Expected the mutated result to leave the cache intact"
+
+
+def test_get_savingsplan_no_upfront_usd_per_hour_accepts_set_payment_options(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = DummySavingsPlansClient(response=_savings_plan_response())
+
+    def _fake_client(service_name: str, region_name: str | None = None) -> DummySavingsPlansClient:
+        return client
+
+    _patch_boto3(monkeypatch, fake_client=_fake_client)
+
+    result = pricing.get_savingsplan_no_upfront_usd_per_hour(
+        instance_type="m6i.large",
+        region="ap-southeast-2",
+        os="Linux",
+        plan_type="Compute",
+        savingsPlanPaymentOptions={"No Upfront"},
+    )
+
+    assert result == {"1y": Decimal("0.052"), "3y": Decimal("0.047")}
+    assert client.calls[-1]["savingsPlanPaymentOptions"] == ["No Upfront"]
+
+
+def test_get_ondemand_usd_per_hour_supports_float_rates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    price_list_entry = pricing_fixtures.make_price_list_entry(usd_per_hour="0.096")
+    client = DummyPricingClient(
+        response={"PriceList": [price_list_entry], "FormatVersion": "aws_v1"}
+    )
+
+    def _fake_client(service_name: str, region_name: str | None = None) -> DummyPricingClient:
+        return client
+
+    _patch_boto3(monkeypatch, fake_client=_fake_client)
+
+    result = pricing.get_ondemand_usd_per_hour(
+        instance_type="m6i.large",
+        region="ap-southeast-2",
+        os="Linux",
+        rate_type=float,
+    )
+
+    assert isinstance(result, float)
+    assert result == pytest.approx(0.096)
+
+
+def test_get_savingsplan_no_upfront_usd_per_hour_supports_float_rates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = DummySavingsPlansClient(response=_savings_plan_response())
+
+    def _fake_client(service_name: str, region_name: str | None = None) -> DummySavingsPlansClient:
+        return client
+
+    _patch_boto3(monkeypatch, fake_client=_fake_client)
+
+    result = pricing.get_savingsplan_no_upfront_usd_per_hour(
+        instance_type="m6i.large",
+        region="ap-southeast-2",
+        os="Linux",
+        plan_type="Compute",
+        rate_type=float,
+    )
+
+    assert all(isinstance(rate, float) for rate in result.values())
+    assert result == {"1y": pytest.approx(0.052), "3y": pytest.approx(0.047)}
+
+
+def test_get_ondemand_usd_per_hour_parses_eagerly_without_ijson(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(pricing, "ijson", None, raising=False)
+    entries = [
+        pricing_fixtures.make_price_list_entry(usd_per_hour="0.5", unit="Quantity"),
+        pricing_fixtures.make_price_list_entry(usd_per_hour="0.096"),
+    ]
+    client = DummyPricingClient(response={"PriceList": entries, "FormatVersion": "aws_v1"})
+
+    def _fake_client(service_name: str, region_name: str | None = None) -> DummyPricingClient:
+        return client
+
+    _patch_boto3(monkeypatch, fake_client=_fake_client)
+
+    result = pricing.get_ondemand_usd_per_hour(
+        instance_type="m6i.large",
+        region="ap-southeast-2",
+        os="Linux",
+    )
+
+    assert result == Decimal("0.096")
+
+
+def test_get_ondemand_usd_per_hour_streams_multi_entry_responses(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pytest.importorskip("ijson")
+
+    entries = [
+        pricing_fixtures.make_price_list_entry(usd_per_hour="0.5", unit="Quantity"),
+        pricing_fixtures.make_price_list_entry(usd_per_hour="0.096"),
+    ]
+    client = DummyPricingClient(response={"PriceList": entries, "FormatVersion": "aws_v1"})
+
+    def _fake_client(service_name: str, region_name: str | None = None) -> DummyPricingClient:
+        return client
+
+    _patch_boto3(monkeypatch, fake_client=_fake_client)
+
+    result = pricing.get_ondemand_usd_per_hour(
+        instance_type="m6i.large",
+        region="ap-southeast-2",
+        os="Linux",
+    )
+
+    assert result == Decimal("0.096")
+
+
+def test_get_savingsplan_no_upfront_usd_per_hour_handles_large_result_sets(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    search_results = []
+    for i in range(40):
+        search_results.append(
+            pricing_fixtures.make_savings_plan_result(
+                usd_per_hour=f"{0.300 - i * 0.001:.4f}", duration_seconds=31_536_000
+            )
+        )
+        search_results.append(
+            pricing_fixtures.make_savings_plan_result(
+                usd_per_hour=f"{0.200 - i * 0.001:.4f}", duration_seconds=94_608_000
+            )
+        )
+    client = DummySavingsPlansClient(response={"searchResults": search_results})
+
+    def _fake_client(service_name: str, region_name: str | None = None) -> DummySavingsPlansClient:
+        return client
+
+    _patch_boto3(monkeypatch, fake_client=_fake_client)
+
+    result = pricing.get_savingsplan_no_upfront_usd_per_hour(
+        instance_type="m6i.large",
+        region="ap-southeast-2",
+        os="Linux",
+        plan_type="Compute",
+    )
+
+    assert result == {"1y": Decimal("0.261"), "3y": Decimal("0.161")}
+
+
+def test_min_rates_by_label_compiled_matches_pure_python_reduction() -> None:
+    pytest.importorskip("numba")
+
+    durations = []
+    rate_values = []
+    for i in range(40):
+        durations.append(31_536_000)
+        rate_values.append(f"{0.300 - i * 0.001:.4f}")
+        durations.append(94_608_000)
+        rate_values.append(f"{0.200 - i * 0.001:.4f}")
+
+    result = pricing._min_rates_by_label_compiled(
+        durations, rate_values, rate_type=Decimal
+    )
+
+    assert result == {"1y": Decimal("0.261"), "3y": Decimal("0.161")}
+    assert all(isinstance(rate, Decimal) for rate in result.values())
+
+
+def test_memoization_shares_entries_with_explicit_default_arguments(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    price_list_entry = pricing_fixtures.make_price_list_entry(usd_per_hour="0.096")
+    client = DummyPricingClient(
+        response={"PriceList": [price_list_entry], "FormatVersion": "aws_v1"}
+    )
+
+    def _fake_client(service_name: str, region_name: str | None = None) -> DummyPricingClient:
+        return client
+
+    _patch_boto3(monkeypatch, fake_client=_fake_client)
+
+    kwargs = {"instance_type": "m6i.large", "region": "ap-southeast-2", "os": "Linux"}
+    pricing.get_ondemand_usd_per_hour(**kwargs, rate_type=Decimal)
+    pricing.get_ondemand_usd_per_hour(**kwargs)
+
+    assert len(client.calls) == 1, (
+        "Expected spelling out the default rate_type to share the cache entry"
+    )
+
+
+def test_memoization_eviction_is_safe_under_concurrent_lookups(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(pricing, "_PRICE_CACHE_MAX_ENTRIES", 2)
+
+    class BulkPricingClient:
+        def get_products(self, **kwargs: Any) -> dict[str, Any]:
+            entry = pricing_fixtures.make_price_list_entry(usd_per_hour="0.096")
+            return {"PriceList": [entry], "FormatVersion": "aws_v1"}
+
+    client = BulkPricingClient()
+
+    def _fake_client(service_name: str, region_name: str | None = None) -> BulkPricingClient:
+        return client
+
+    _patch_boto3(monkeypatch, fake_client=_fake_client)
+
+    instance_types = [f"m6i.{size}xlarge" for size in range(1, 33)]
+    result = pricing.get_ondemand_usd_per_hour_bulk(
+        instance_types=instance_types,
+        region="ap-southeast-2",
+        os="Linux",
+    )
+
+    assert set(result) == set(instance_types)
+    assert all(price == Decimal("0.096") for price in result.values())
+
+
+def test_streaming_and_eager_extraction_agree_on_multi_term_entries() -> None:
+    pytest.importorskip("ijson")
+    import json
+
+    # Only the second OnDemand term carries a supported hourly price; both
+    # extractors inspect the first term only, so both must reject the entry.
+    entry = json.dumps(
+        {
+            "terms": {
+                "OnDemand": {
+                    "SKU.FIRST": {
+                        "priceDimensions": {
+                            "SKU.FIRST.DIM": {
+                                "unit": "Quantity",
+                                "pricePerUnit": {"USD": "100"},
+                            }
+                        }
+                    },
+                    "SKU.SECOND": {
+                        "priceDimensions": {
+                            "SKU.SECOND.DIM": {
+                                "unit": "Hrs",
+                                "pricePerUnit": {"USD": "0.096"},
+                            }
+                        }
+                    },
+                }
+            }
+        }
+    )
+
+    streamed = pricing._stream_ondemand_usd(entry)
+    eager = pricing._extract_ondemand_usd(json.loads(entry))
+
+    assert streamed is None
+    assert streamed == eager